@@ -5,6 +5,7 @@ for GolfMCP servers. Users can configure authentication in their pre_build.py
 file without needing to understand the complexities of the MCP SDK.
 """
 
+from functools import cached_property
 from typing import List, Optional, Tuple
 
 from mcp.server.auth.settings import AuthSettings, ClientRegistrationOptions
@@ -40,21 +41,30 @@ class AuthConfig:
         self.login_path = login_path
         self.error_path = error_path
         self.redirect_uri = redirect_uri
+    
+    @cached_property
+    def provider(self) -> GolfOAuthProvider:
+        """OAuth provider, created on first access.
         
-        # Create the OAuth provider
-        self.provider = GolfOAuthProvider(provider_config)
+        Builds only read the provider configuration, so the provider
+        and its token storage are only constructed when actually used.
+        """
+        provider = GolfOAuthProvider(self.provider_config)
         # Make the configured redirect URI available to the provider
-        self.provider.default_redirect_uri = redirect_uri
-        
-        # Create auth settings for FastMCP
-        self.auth_settings = AuthSettings(
-            issuer_url=provider_config.issuer_url or "http://localhost:3000",
+        provider.default_redirect_uri = self.redirect_uri
+        return provider
+    
+    @cached_property
+    def auth_settings(self) -> AuthSettings:
+        """Auth settings for FastMCP, created on first access."""
+        return AuthSettings(
+            issuer_url=self.provider_config.issuer_url or "http://localhost:3000",
             client_registration_options=ClientRegistrationOptions(
                 enabled=True,
-                valid_scopes=provider_config.scopes,
-                default_scopes=provider_config.scopes
+                valid_scopes=self.provider_config.scopes,
+                default_scopes=self.provider_config.scopes
             ),
-            required_scopes=required_scopes or provider_config.scopes
+            required_scopes=self.required_scopes or self.provider_config.scopes
         )
 
 # Global state for the build process
@@ -10,6 +10,8 @@ import uuid
 import jwt
 import httpx
 import os
+import secrets
+import urllib.parse
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 
@@ -369,9 +371,6 @@ class GolfOAuthProvider(OAuthAuthorizationServerProvider):
         This method is called when an MCP client requests authorization.
         It should return a URL to redirect the user to the external IdP (e.g., GitHub).
         """
-        import secrets
-        import urllib.parse
-
         idp_flow_state = secrets.token_hex(16)
         mcp_client_original_state = params.state 
         
@@ -789,7 +788,6 @@ def create_callback_handler(provider: GolfOAuthProvider):
             if mcp_client_original_state_to_pass_back:
                 query_params_for_mcp_client["state"] = mcp_client_original_state_to_pass_back
                 
-            import urllib.parse # Ensure it's imported here too
             final_query_for_mcp_client = urllib.parse.urlencode(query_params_for_mcp_client)
             final_redirect_to_mcp_client = f"{original_mcp_redirect_uri}?{final_query_for_mcp_client}"
             
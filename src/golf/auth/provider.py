@@ -7,6 +7,9 @@ OAuth authentication for GolfMCP servers.
 from typing import Dict, List, Optional, Any
 from pydantic import BaseModel, Field, field_validator
 
+# Provider types accepted without a 'custom:' prefix
+_KNOWN_PROVIDERS = frozenset({'custom', 'github', 'google', 'jwks'})
+
 
 class ProviderConfig(BaseModel):
     """Configuration for an OAuth2 provider.
@@ -90,11 +93,9 @@ class ProviderConfig(BaseModel):
         Raises:
             ValueError: If the provider type is not supported
         """
-        known_providers = {'custom', 'github', 'google', 'jwks'}
-        
-        if value not in known_providers and not value.startswith('custom:'):
+        if value not in _KNOWN_PROVIDERS and not value.startswith('custom:'):
             raise ValueError(
-                f"Unknown provider: '{value}'. Must be one of {known_providers} "
+                f"Unknown provider: '{value}'. Must be one of {sorted(_KNOWN_PROVIDERS)} "
                 "or start with 'custom:'"
             )
         return value
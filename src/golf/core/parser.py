@@ -22,6 +22,27 @@ class ComponentType(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Map each top-level component directory to its component type
+_DIRECTORY_TYPES: Dict[str, ComponentType] = {
+    "tools": ComponentType.TOOL,
+    "resources": ComponentType.RESOURCE,
+    "prompts": ComponentType.PROMPT,
+}
+
+# Matches "{param}" placeholders in resource URI templates
+_URI_PARAM_PATTERN = re.compile(r"{([^}]+)}")
+
+# Python type hint substrings and their JSON schema types, checked in order
+_TYPE_HINT_JSON_TYPES = (
+    ("str", "string"),
+    ("int", "integer"),
+    ("float", "number"),
+    ("bool", "boolean"),
+    ("list", "array"),
+    ("dict", "object"),
+)
+
+
 @dataclass
 class ParsedComponent:
     """Represents a parsed MCP component (tool, resource, or prompt)."""
@@ -84,13 +105,7 @@ class AstParser:
         rel_path = file_path.relative_to(self.project_root)
         parent_dir = rel_path.parts[0] if rel_path.parts else None
         
-        component_type = ComponentType.UNKNOWN
-        if parent_dir == "tools":
-            component_type = ComponentType.TOOL
-        elif parent_dir == "resources":
-            component_type = ComponentType.RESOURCE
-        elif parent_dir == "prompts":
-            component_type = ComponentType.PROMPT
+        component_type = _DIRECTORY_TYPES.get(parent_dir, ComponentType.UNKNOWN)
         
         if component_type == ComponentType.UNKNOWN:
             return []  # Not in a recognized directory
@@ -247,7 +262,7 @@ class AstParser:
                             component.uri_template = uri_template
                             
                             # Extract URI parameters (parts in {})
-                            uri_params = re.findall(r"{([^}]+)}", uri_template)
+                            uri_params = _URI_PARAM_PATTERN.findall(uri_template)
                             if uri_params:
                                 component.parameters = uri_params
                             break
@@ -268,7 +283,7 @@ class AstParser:
         category = None
         category_idx = -1
         for i, part in enumerate(rel_path.parts):
-            if part in ["tools", "resources", "prompts"]:
+            if part in _DIRECTORY_TYPES:
                 category = part
                 category_idx = i
                 break
@@ -386,18 +401,11 @@ class AstParser:
         This is a simplified version. A more sophisticated approach would
         handle complex types correctly.
         """
-        type_map = {
-            "str": "string",
-            "int": "integer",
-            "float": "number",
-            "bool": "boolean",
-            "list": "array",
-            "dict": "object",
-        }
+        type_hint = type_hint.lower()
         
         # Handle simple types
-        for py_type, json_type in type_map.items():
-            if py_type in type_hint.lower():
+        for py_type, json_type in _TYPE_HINT_JSON_TYPES:
+            if py_type in type_hint:
                 return json_type
         
         # Default to string for unknown types
@@ -415,11 +423,7 @@ def parse_project(project_path: Path) -> Dict[ComponentType, List[ParsedComponen
     }
     
     # Parse each directory
-    for comp_type, dir_name in [
-        (ComponentType.TOOL, "tools"),
-        (ComponentType.RESOURCE, "resources"),
-        (ComponentType.PROMPT, "prompts")
-    ]:
+    for dir_name, comp_type in _DIRECTORY_TYPES.items():
         dir_path = project_path / dir_name
         if dir_path.exists() and dir_path.is_dir():
             dir_components = parser.parse_directory(dir_path)
@@ -447,11 +451,7 @@ def parse_project_incremental(project_path: Path, fingerprints: Dict[str, str])
     }
     
     # Process each directory
-    for comp_type, dir_name in [
-        (ComponentType.TOOL, "tools"),
-        (ComponentType.RESOURCE, "resources"),
-        (ComponentType.PROMPT, "prompts")
-    ]:
+    for dir_name, comp_type in _DIRECTORY_TYPES.items():
         dir_path = project_path / dir_name
         if not dir_path.exists() or not dir_path.is_dir():
             continue
@@ -491,7 +491,7 @@ def parse_common_files(project_path: Path) -> Dict[str, Path]:
     common_files = {}
     
     # Search for common.py files in tools, resources, and prompts directories
-    for dir_name in ["tools", "resources", "prompts"]:
+    for dir_name in _DIRECTORY_TYPES:
         base_dir = project_path / dir_name
         if not base_dir.exists() or not base_dir.is_dir():
             continue